@@ -5,18 +5,35 @@ Integrated AI-powered QA system specifically designed for the Catalogizer projec
 This orchestrator understands and tests all Catalogizer components natively.
 """
 
+import argparse
 import asyncio
+import gzip
 import json
 import logging
 import os
+import re
 import sqlite3
 import subprocess
 import time
+import types
 import yaml
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields, is_dataclass
+
+# orjson is ~5x faster than stdlib json on nested report structures;
+# fall back to stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgspec provides the binary msgpack report format for machine consumers
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # Import existing Catalogizer modules (when available)
 import sys
@@ -24,8 +41,82 @@ sys.path.append('/home/milosvasic/Projects/Catalogizer/catalog-api')
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+)')
+
+# Status glyphs looked up once per line instead of inline ternaries
+_STATUS_GLYPH = {True: '✅ PASSED', False: '❌ FAILED'}
+
+# Summary banner strings built once at import, not per summary
+_BANNER = "=" * 70
+_HEADER = f"\n{_BANNER}\n🎯 CATALOGIZER ZERO-DEFECT QA RESULTS\n{_BANNER}"
+
+# Verdict blocks keyed by overall_zero_defect — both outcomes are static
+_VERDICT_LINES = {
+    True: (
+        "🎉 RESULT: ZERO DEFECTS ACHIEVED!",
+        "   Your Catalogizer system is production-ready!",
+        "   All components work perfectly. Deploy with confidence!",
+    ),
+    False: (
+        "⚠️  RESULT: ISSUES FOUND",
+        "   Zero-defect criteria not met.",
+        "   Please review and fix issues before deployment.",
+    ),
+}
+
+# Reports estimated under this size serialize into one buffer; larger
+# ones stream so peak memory stays bounded
+_STREAM_THRESHOLD = 64 * 1024
+
+# Simulated media-feature results — read-only template built once at
+# import instead of rebuilt per validation run
+_STATIC_MEDIA_RESULTS = types.MappingProxyType({
+    'tests_passed': 150,
+    'recommendation_tests_passed': 75,
+    'deep_linking_tests_passed': 50,
+    'zero_defect_achieved': True,
+})
+
+
+async def _run_command(cmd: List[str], cwd: Optional[str] = None) -> tuple:
+    """Run a command without blocking the event loop.
+
+    Returns (returncode, stdout, stderr) with output decoded as text.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
+
+class _ReportEncoder(json.JSONEncoder):
+    """Dataclass-aware stdlib encoder.
+
+    Builds one shallow dict per dataclass level instead of the full
+    object-graph clone asdict() performs; everything else degrades to str.
+    """
+
+    def default(self, o):
+        if is_dataclass(o):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        return str(o)
+
+
+async def _safe_body(response, limit: int = 4096) -> str:
+    """Read at most `limit` bytes of a response body.
+
+    Error payloads are only logged/reported, so there is no reason to
+    slurp arbitrarily large bodies into memory.
+    """
+    raw = await response.content.read(limit)
+    return raw.decode(response.charset or 'utf-8', errors='replace')
+
+
+@dataclass(slots=True)
 class CatalogizerComponent:
     """Represents a Catalogizer component under test."""
     name: str
@@ -33,12 +124,12 @@ class CatalogizerComponent:
     path: str
     status: str = 'not_tested'
     version: str = 'unknown'
-    dependencies: List[str] = None
-    test_results: Dict[str, Any] = None
+    dependencies: List[str] = field(default_factory=list)
+    test_results: Dict[str, Any] = field(default_factory=dict)
     zero_defect_status: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalogizerQASession:
     """QA session specifically for Catalogizer testing."""
     id: str
@@ -46,14 +137,87 @@ class CatalogizerQASession:
     components_tested: List[str]
     start_time: datetime
     end_time: Optional[datetime] = None
-    api_status: str = 'unknown'
-    android_status: str = 'unknown'
-    database_status: str = 'unknown'
-    integration_status: str = 'unknown'
+    api_ok: bool = False
+    android_ok: bool = False
+    database_ok: bool = False
+    integration_ok: bool = False
     media_tests_passed: int = 0
     recommendation_tests_passed: int = 0
     deep_linking_tests_passed: int = 0
     overall_zero_defect: bool = False
+    deployment_recommendation: str = ''
+    duration_seconds: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointSpec:
+    """A single API endpoint probe."""
+    method: str
+    path: str
+    expected_status: int
+    data: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class UITestSpec:
+    """A single Android UI test scenario."""
+    name: str
+    action: str
+
+
+@dataclass(frozen=True, slots=True)
+class MediaTestFile:
+    """A known media file with its expected recognition result."""
+    path: str
+    expected_title: Optional[str] = None
+    expected_year: Optional[int] = None
+    expected_artist: Optional[str] = None
+    expected_type: Optional[str] = None
+
+
+# All Catalogizer API endpoints to test — static, so defined once at import
+ENDPOINTS = (
+    # Core endpoints
+    EndpointSpec('GET', '/health', 200),
+    EndpointSpec('GET', '/api/v1/catalog', 200),
+
+    # Media recognition endpoints
+    EndpointSpec('POST', '/api/v1/media/recognize', 200,
+                 data={'file_path': '/test/sample.mp3', 'media_type': 'audio'}),
+
+    # Recommendation endpoints
+    EndpointSpec('GET', '/api/v1/media/123/similar', 200),
+    EndpointSpec('POST', '/api/v1/media/similar', 200,
+                 data={'media_id': 123, 'max_results': 10}),
+
+    # Deep linking endpoints
+    EndpointSpec('POST', '/api/v1/links/generate', 200,
+                 data={'media_id': 123, 'platform': 'web'}),
+    EndpointSpec('POST', '/api/v1/links/smart', 200,
+                 data={'media_id': 123}),
+
+    # File operations
+    EndpointSpec('GET', '/api/v1/search', 200),
+    EndpointSpec('GET', '/api/v1/stats/overall', 200),
+)
+
+# Known media files from the media bank used for recognition accuracy tests
+TEST_FILES = (
+    MediaTestFile('/test/media/The_Matrix_1999.mp4',
+                  expected_title='The Matrix', expected_year=1999),
+    MediaTestFile('/test/media/Bohemian_Rhapsody.mp3',
+                  expected_artist='Queen', expected_title='Bohemian Rhapsody'),
+    MediaTestFile('/test/media/sample_book.pdf', expected_type='book'),
+)
+
+# Android UI test scenarios (serial — they share one device)
+UI_TESTS = (
+    UITestSpec('main_activity_loads', 'check_main_screen'),
+    UITestSpec('media_browser_works', 'test_media_browsing'),
+    UITestSpec('media_player_works', 'test_media_playback'),
+    UITestSpec('search_functionality', 'test_search'),
+    UITestSpec('recommendations_display', 'test_recommendations'),
+)
 
 
 class CatalogizerAPITester:
@@ -63,23 +227,69 @@ class CatalogizerAPITester:
         self.api_base_path = api_base_path
         self.base_url = 'http://localhost:8080'
         self.api_process = None
+        self._session = None
+        self._owns_session = False
+
+        # Precomputed per endpoint: name, method, full URL, request kwargs
+        # and expected status — keeps the test loop free of per-request
+        # f-string formatting and dict lookups.
+        self._endpoint_plan = [
+            (
+                f"{ep.method} {ep.path}",
+                ep.method,
+                f"{self.base_url}{ep.path}",
+                {'json': ep.data} if ep.data is not None else {},
+                ep.expected_status
+            )
+            for ep in ENDPOINTS
+        ]
+
+    async def _ensure_session(self):
+        """Return the shared aiohttp session, creating it on first use."""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            # Unlimited pool skips aiohttp's per-host acquisition tracking;
+            # the DNS cache avoids re-resolving localhost on every request.
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=0,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30, connect=5)
+            )
+            self._owns_session = True
+
+        return self._session
 
     async def start_api_server(self) -> bool:
         """Start the Catalogizer API server for testing."""
         logger.info("Starting Catalogizer API server...")
 
         try:
-            # Build the API if needed
-            build_result = subprocess.run(
-                ['go', 'build', '-o', 'catalog-api', 'main.go'],
-                cwd=self.api_base_path,
-                capture_output=True,
-                text=True
+            # Build the API only when the binary is missing or older than
+            # main.go — repeat invocations skip the multi-second Go build
+            binary_path = os.path.join(self.api_base_path, 'catalog-api')
+            source_path = os.path.join(self.api_base_path, 'main.go')
+
+            needs_build = not (
+                os.path.exists(binary_path) and
+                os.path.getmtime(binary_path) >= os.path.getmtime(source_path)
             )
 
-            if build_result.returncode != 0:
-                logger.error(f"API build failed: {build_result.stderr}")
-                return False
+            if needs_build:
+                returncode, _, stderr = await _run_command(
+                    ['go', 'build', '-o', 'catalog-api', 'main.go'],
+                    cwd=self.api_base_path
+                )
+
+                if returncode != 0:
+                    logger.error(f"API build failed: {stderr}")
+                    return False
 
             # Start the API server
             self.api_process = subprocess.Popen(
@@ -89,11 +299,28 @@ class CatalogizerAPITester:
                 stderr=subprocess.PIPE
             )
 
-            # Wait for server to start
-            await asyncio.sleep(3)
+            # Poll the health endpoint instead of a fixed sleep so fast
+            # starts are not penalized and slow starts are not missed.
+            session = await self._ensure_session()
+
+            async def _wait_for_health():
+                while True:
+                    if self.api_process.poll() is not None:
+                        return False
+                    try:
+                        async with session.get(f"{self.base_url}/health") as response:
+                            if response.status == 200:
+                                return True
+                    except Exception:
+                        pass
+                    await asyncio.sleep(0.5)
+
+            try:
+                ready = await asyncio.wait_for(_wait_for_health(), timeout=30)
+            except asyncio.TimeoutError:
+                ready = False
 
-            # Check if server is running
-            if self.api_process.poll() is None:
+            if ready:
                 logger.info("Catalogizer API server started successfully")
                 return True
             else:
@@ -116,69 +343,102 @@ class CatalogizerAPITester:
             'zero_defect_achieved': False
         }
 
-        # Define all Catalogizer API endpoints to test
-        endpoints = [
-            # Core endpoints
-            {'method': 'GET', 'path': '/health', 'expected_status': 200},
-            {'method': 'GET', 'path': '/api/v1/catalog', 'expected_status': 200},
-
-            # Media recognition endpoints
-            {'method': 'POST', 'path': '/api/v1/media/recognize', 'expected_status': 200,
-             'data': {'file_path': '/test/sample.mp3', 'media_type': 'audio'}},
-
-            # Recommendation endpoints
-            {'method': 'GET', 'path': '/api/v1/media/123/similar', 'expected_status': 200},
-            {'method': 'POST', 'path': '/api/v1/media/similar', 'expected_status': 200,
-             'data': {'media_id': 123, 'max_results': 10}},
-
-            # Deep linking endpoints
-            {'method': 'POST', 'path': '/api/v1/links/generate', 'expected_status': 200,
-             'data': {'media_id': 123, 'platform': 'web'}},
-            {'method': 'POST', 'path': '/api/v1/links/smart', 'expected_status': 200,
-             'data': {'media_id': 123}},
-
-            # File operations
-            {'method': 'GET', 'path': '/api/v1/search', 'expected_status': 200},
-            {'method': 'GET', 'path': '/api/v1/stats/overall', 'expected_status': 200},
-        ]
-
-        async with aiohttp.ClientSession() as session:
-            for endpoint in endpoints:
-                test_results['endpoints_tested'] += 1
-                endpoint_name = f"{endpoint['method']} {endpoint['path']}"
+        # Bound concurrency so the fan-out does not overwhelm the API server
+        semaphore = asyncio.Semaphore(16)
+        session = await self._ensure_session()
 
-                try:
-                    kwargs = {'url': f"{self.base_url}{endpoint['path']}"}
-
-                    if endpoint['method'] == 'POST' and 'data' in endpoint:
-                        kwargs['json'] = endpoint['data']
+        retryable = (
+            aiohttp.ClientConnectionError,
+            aiohttp.ServerDisconnectedError,
+            asyncio.TimeoutError
+        )
+        attempts = 3
+
+        async def test_endpoint(method, url, kwargs, expected_status):
+            async with semaphore:
+                last_error = None
+
+                for attempt in range(attempts):
+                    if attempt:
+                        # Exponential backoff: 100/300/900ms between tries
+                        await asyncio.sleep(0.1 * 3 ** (attempt - 1))
+
+                    start = time.perf_counter()
+                    try:
+                        async with session.request(method, url, **kwargs) as response:
+                            # A transient 5xx from a still-warming server is
+                            # worth retrying before calling the endpoint broken
+                            if (response.status >= 500 and
+                                    response.status != expected_status and
+                                    attempt < attempts - 1):
+                                continue
+
+                            success = response.status == expected_status
+
+                            if success:
+                                try:
+                                    result_data = await response.json()
+                                except aiohttp.ContentTypeError:
+                                    result_data = await _safe_body(response)
+                            else:
+                                result_data = await _safe_body(response)
+
+                            return {
+                                'success': success,
+                                'status_code': response.status,
+                                'response_time_ms': (time.perf_counter() - start) * 1000,
+                                'response_data': result_data
+                            }
+                    except retryable as e:
+                        # GETs are idempotent and retried freely. Non-GETs
+                        # are replayed only on timeout: the request may
+                        # already have been processed server-side, which
+                        # these QA probes tolerate — any other transport
+                        # error is surfaced immediately instead of masked.
+                        if method != 'GET' and not isinstance(e, asyncio.TimeoutError):
+                            raise
+                        last_error = e
+
+                raise last_error
+
+        # Dispatch all endpoint tests concurrently over the shared session
+        results = await asyncio.gather(
+            *(test_endpoint(method, url, kwargs, expected)
+              for _, method, url, kwargs, expected in self._endpoint_plan),
+            return_exceptions=True
+        )
 
-                    async with session.request(endpoint['method'], **kwargs) as response:
-                        success = response.status == endpoint['expected_status']
+        for (endpoint_name, *_), result in zip(self._endpoint_plan, results):
+            test_results['endpoints_tested'] += 1
 
-                        if success:
-                            test_results['endpoints_passed'] += 1
-                            result_data = await response.json() if response.content_type == 'application/json' else await response.text()
-                        else:
-                            test_results['endpoints_failed'] += 1
-                            result_data = await response.text()
+            if isinstance(result, Exception):
+                test_results['endpoints_failed'] += 1
+                test_results['detailed_results'][endpoint_name] = {
+                    'success': False,
+                    'error': str(result)
+                }
+                logger.error(f"Error testing {endpoint_name}: {result}")
+                continue
 
-                        test_results['detailed_results'][endpoint_name] = {
-                            'success': success,
-                            'status_code': response.status,
-                            'response_time': 0,  # Would measure actual response time
-                            'response_data': result_data
-                        }
+            if result['success']:
+                test_results['endpoints_passed'] += 1
+            else:
+                test_results['endpoints_failed'] += 1
 
-                        logger.info(f"Tested {endpoint_name}: {'✅ PASS' if success else '❌ FAIL'}")
+            test_results['detailed_results'][endpoint_name] = result
+            logger.info(f"Tested {endpoint_name}: {'✅ PASS' if result['success'] else '❌ FAIL'}")
 
-                except Exception as e:
-                    test_results['endpoints_failed'] += 1
-                    test_results['detailed_results'][endpoint_name] = {
-                        'success': False,
-                        'error': str(e)
-                    }
-                    logger.error(f"Error testing {endpoint_name}: {e}")
+        # Aggregate latency percentiles for regression tracking
+        latencies = sorted(
+            result['response_time_ms'] for result in results
+            if not isinstance(result, Exception)
+        )
+        if latencies:
+            test_results['latency_summary'] = {
+                'min_ms': latencies[0],
+                'p50_ms': latencies[len(latencies) // 2],
+                'p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            }
 
         # Determine zero-defect status
         test_results['zero_defect_achieved'] = (
@@ -197,40 +457,38 @@ class CatalogizerAPITester:
             'zero_defect_achieved': False
         }
 
-        # Test with known media files from the media bank
-        test_files = [
-            {'path': '/test/media/The_Matrix_1999.mp4', 'expected_title': 'The Matrix', 'expected_year': 1999},
-            {'path': '/test/media/Bohemian_Rhapsody.mp3', 'expected_artist': 'Queen', 'expected_title': 'Bohemian Rhapsody'},
-            {'path': '/test/media/sample_book.pdf', 'expected_type': 'book'},
-        ]
+        session = await self._ensure_session()
 
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            for test_file in test_files:
-                recognition_results['files_tested'] += 1
+        async def probe(test_file):
+            try:
+                data = {
+                    'file_path': test_file.path,
+                    'media_type': test_file.expected_type or 'unknown'
+                }
+
+                async with session.post(
+                    f"{self.base_url}/api/v1/media/recognize",
+                    json=data
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        # Check recognition accuracy
+                        return self._validate_recognition_result(result, test_file)
 
-                try:
-                    data = {
-                        'file_path': test_file['path'],
-                        'media_type': test_file.get('expected_type', 'unknown')
-                    }
+            except Exception as e:
+                logger.error(f"Error testing recognition for {test_file.path}: {e}")
 
-                    async with session.post(
-                        f"{self.base_url}/api/v1/media/recognize",
-                        json=data
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
+            return False
 
-                            # Check recognition accuracy
-                            correct = self._validate_recognition_result(result, test_file)
-                            if correct:
-                                recognition_results['correct_recognitions'] += 1
+        # Recognition probes are pure network calls — fan them all out
+        results = await asyncio.gather(*(probe(test_file) for test_file in TEST_FILES))
 
-                            logger.info(f"Recognition test {test_file['path']}: {'✅ CORRECT' if correct else '❌ INCORRECT'}")
+        for test_file, correct in zip(TEST_FILES, results):
+            recognition_results['files_tested'] += 1
+            if correct:
+                recognition_results['correct_recognitions'] += 1
 
-                except Exception as e:
-                    logger.error(f"Error testing recognition for {test_file['path']}: {e}")
+            logger.info(f"Recognition test {test_file.path}: {'✅ CORRECT' if correct else '❌ INCORRECT'}")
 
         # Calculate accuracy
         if recognition_results['files_tested'] > 0:
@@ -243,7 +501,7 @@ class CatalogizerAPITester:
 
         return recognition_results
 
-    def _validate_recognition_result(self, result: Dict[str, Any], expected: Dict[str, Any]) -> bool:
+    def _validate_recognition_result(self, result: Dict[str, Any], expected: MediaTestFile) -> bool:
         """Validate recognition result against expected values."""
         if 'data' not in result:
             return False
@@ -251,27 +509,38 @@ class CatalogizerAPITester:
         data = result['data']
 
         # Check expected title
-        if 'expected_title' in expected:
-            if data.get('title', '').lower() != expected['expected_title'].lower():
+        if expected.expected_title is not None:
+            if data.get('title', '').lower() != expected.expected_title.lower():
                 return False
 
         # Check expected year
-        if 'expected_year' in expected:
-            if data.get('year') != expected['expected_year']:
+        if expected.expected_year is not None:
+            if data.get('year') != expected.expected_year:
                 return False
 
         # Check expected artist
-        if 'expected_artist' in expected:
-            if data.get('artist', '').lower() != expected['expected_artist'].lower():
+        if expected.expected_artist is not None:
+            if data.get('artist', '').lower() != expected.expected_artist.lower():
                 return False
 
         return True
 
-    def stop_api_server(self):
-        """Stop the API server."""
+    async def stop_api_server(self):
+        """Stop the API server and release the HTTP session if we own it."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+            self._session = None
+            self._owns_session = False
+
         if self.api_process:
             self.api_process.terminate()
-            self.api_process.wait()
+            # Reap off-loop so a slow shutdown cannot stall other phases
+            try:
+                await asyncio.wait_for(asyncio.to_thread(self.api_process.wait), 5)
+            except asyncio.TimeoutError:
+                self.api_process.kill()
+                await asyncio.to_thread(self.api_process.wait)
+            self.api_process = None
             logger.info("Catalogizer API server stopped")
 
 
@@ -288,18 +557,16 @@ class CatalogizerAndroidTester:
 
         try:
             # Run Gradle build
-            build_result = subprocess.run(
+            returncode, _, stderr = await _run_command(
                 ['./gradlew', 'assembleDebug'],
-                cwd=self.android_app_path,
-                capture_output=True,
-                text=True
+                cwd=self.android_app_path
             )
 
-            if build_result.returncode == 0:
+            if returncode == 0:
                 logger.info("Android app built successfully")
                 return True
             else:
-                logger.error(f"Android build failed: {build_result.stderr}")
+                logger.error(f"Android build failed: {stderr}")
                 return False
 
         except Exception as e:
@@ -316,23 +583,30 @@ class CatalogizerAndroidTester:
                 'emulator', '-avd', 'Catalogizer_Test_Device', '-no-audio', '-no-boot-anim'
             ])
 
-            # Wait for emulator to boot
-            await asyncio.sleep(30)
-
-            # Check if device is ready
-            adb_result = subprocess.run(
-                ['adb', 'shell', 'getprop', 'sys.boot_completed'],
-                capture_output=True,
-                text=True
-            )
-
-            if adb_result.returncode == 0 and '1' in adb_result.stdout:
-                logger.info("Android emulator ready")
-                return True
-            else:
-                logger.error("Emulator failed to boot properly")
-                return False
+            # Block until adb sees the device, then poll the boot flag —
+            # no fixed 30 second sleep, no false failure on slow boots.
+            wait_proc = await asyncio.create_subprocess_exec('adb', 'wait-for-device')
+            await asyncio.wait_for(wait_proc.wait(), timeout=60)
+
+            async def _wait_for_boot():
+                while True:
+                    proc = await asyncio.create_subprocess_exec(
+                        'adb', 'shell', 'getprop', 'sys.boot_completed',
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    stdout, _ = await proc.communicate()
+                    if proc.returncode == 0 and stdout.strip() == b'1':
+                        return
+                    await asyncio.sleep(0.5)
+
+            await asyncio.wait_for(_wait_for_boot(), timeout=120)
+            logger.info("Android emulator ready")
+            return True
 
+        except asyncio.TimeoutError:
+            logger.error("Emulator failed to boot properly")
+            return False
         except Exception as e:
             logger.error(f"Error starting emulator: {e}")
             return False
@@ -351,23 +625,21 @@ class CatalogizerAndroidTester:
 
         try:
             # Install APK
-            install_result = subprocess.run(
-                ['adb', 'install', '-r', apk_path],
-                capture_output=True,
-                text=True
+            install_returncode, _, _ = await _run_command(
+                ['adb', 'install', '-r', apk_path]
             )
 
-            if install_result.returncode == 0:
+            if install_returncode == 0:
                 test_results['installation_success'] = True
                 logger.info("Android app installed successfully")
 
                 # Launch app
-                launch_result = subprocess.run([
+                launch_returncode, _, _ = await _run_command([
                     'adb', 'shell', 'am', 'start',
                     '-n', 'com.catalogizer.app/.MainActivity'
-                ], capture_output=True, text=True)
+                ])
 
-                if launch_result.returncode == 0:
+                if launch_returncode == 0:
                     test_results['app_launch_success'] = True
                     logger.info("Android app launched successfully")
 
@@ -395,16 +667,7 @@ class CatalogizerAndroidTester:
             'detailed_results': {}
         }
 
-        # Define UI test scenarios
-        ui_tests = [
-            {'name': 'main_activity_loads', 'action': 'check_main_screen'},
-            {'name': 'media_browser_works', 'action': 'test_media_browsing'},
-            {'name': 'media_player_works', 'action': 'test_media_playback'},
-            {'name': 'search_functionality', 'action': 'test_search'},
-            {'name': 'recommendations_display', 'action': 'test_recommendations'},
-        ]
-
-        for test in ui_tests:
+        for test in UI_TESTS:
             try:
                 # Simulate UI test execution
                 success = await self._execute_ui_test(test)
@@ -414,65 +677,75 @@ class CatalogizerAndroidTester:
                 else:
                     ui_results['ui_tests_failed'] += 1
 
-                ui_results['detailed_results'][test['name']] = {
+                ui_results['detailed_results'][test.name] = {
                     'success': success,
-                    'action': test['action']
+                    'action': test.action
                 }
 
-                logger.info(f"UI test {test['name']}: {'✅ PASS' if success else '❌ FAIL'}")
-
-                # Small delay between tests
-                await asyncio.sleep(1)
+                logger.info(f"UI test {test.name}: {'✅ PASS' if success else '❌ FAIL'}")
 
             except Exception as e:
                 ui_results['ui_tests_failed'] += 1
-                ui_results['detailed_results'][test['name']] = {
+                ui_results['detailed_results'][test.name] = {
                     'success': False,
                     'error': str(e)
                 }
-                logger.error(f"UI test {test['name']} failed: {e}")
+                logger.error(f"UI test {test.name} failed: {e}")
 
         return ui_results
 
-    async def _execute_ui_test(self, test: Dict[str, Any]) -> bool:
+    async def _wait_for_foreground(self, marker: str = 'com.catalogizer.app',
+                                   timeout: float = 5.0) -> bool:
+        """Poll the foreground activity until `marker` shows up or the deadline passes."""
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        while True:
+            _, stdout, _ = await _run_command([
+                'adb', 'shell', 'dumpsys', 'activity', 'top'
+            ])
+            if marker in stdout:
+                return True
+            if asyncio.get_running_loop().time() >= deadline:
+                return False
+            await asyncio.sleep(0.5)
+
+    async def _execute_ui_test(self, test: UITestSpec) -> bool:
         """Execute a specific UI test."""
         # In a real implementation, this would use UI testing frameworks
         # like Espresso or UIAutomator2 to interact with the actual app
 
-        action = test['action']
+        action = test.action
 
         if action == 'check_main_screen':
             # Check if main activity is displayed
-            result = subprocess.run([
+            _, stdout, _ = await _run_command([
                 'adb', 'shell', 'dumpsys', 'activity', 'activities'
-            ], capture_output=True, text=True)
-            return 'MainActivity' in result.stdout
+            ])
+            return 'MainActivity' in stdout
 
         elif action == 'test_media_browsing':
             # Test media browsing functionality
             # Simulate navigation to media browser
-            subprocess.run(['adb', 'shell', 'input', 'tap', '200', '300'])
-            await asyncio.sleep(2)
-            return True  # Simplified success
+            await _run_command(['adb', 'shell', 'input', 'tap', '200', '300'])
+            return await self._wait_for_foreground()
 
         elif action == 'test_media_playback':
             # Test media playback
-            subprocess.run(['adb', 'shell', 'input', 'tap', '300', '400'])
-            await asyncio.sleep(2)
-            return True  # Simplified success
+            await _run_command(['adb', 'shell', 'input', 'tap', '300', '400'])
+            return await self._wait_for_foreground()
 
         elif action == 'test_search':
             # Test search functionality
-            subprocess.run(['adb', 'shell', 'input', 'tap', '400', '100'])
-            await asyncio.sleep(1)
-            subprocess.run(['adb', 'shell', 'input', 'text', 'test'])
+            await _run_command(['adb', 'shell', 'input', 'tap', '400', '100'])
+            if not await self._wait_for_foreground():
+                return False
+            await _run_command(['adb', 'shell', 'input', 'text', 'test'])
             return True  # Simplified success
 
         elif action == 'test_recommendations':
             # Test recommendations display
-            subprocess.run(['adb', 'shell', 'input', 'tap', '300', '500'])
-            await asyncio.sleep(2)
-            return True  # Simplified success
+            await _run_command(['adb', 'shell', 'input', 'tap', '300', '500'])
+            return await self._wait_for_foreground()
 
         return False
 
@@ -499,6 +772,16 @@ class CatalogizerDatabaseTester:
             test_results['connection_success'] = True
             logger.info("Database connection successful")
 
+            # Tune the connection: WAL keeps readers from blocking behind
+            # writers and NORMAL sync avoids an fsync per commit. Only
+            # applicable to file-backed databases.
+            if self.database_path != ':memory:':
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute("PRAGMA mmap_size=268435456")
+                conn.execute("PRAGMA cache_size=-64000")
+
             # Test schema validation
             schema_valid = await self._validate_schema(conn)
             test_results['schema_valid'] = schema_valid
@@ -511,36 +794,41 @@ class CatalogizerDatabaseTester:
             performance_ok = await self._test_performance(conn)
             test_results['performance_acceptable'] = performance_ok
 
+            # Let SQLite refresh its query-planner statistics before closing
+            conn.execute("PRAGMA optimize")
             conn.close()
 
         except Exception as e:
             logger.error(f"Database testing error: {e}")
 
         # Determine zero-defect status
-        test_results['zero_defect_achieved'] = all([
-            test_results['connection_success'],
-            test_results['schema_valid'],
-            test_results['crud_operations_success'],
+        test_results['zero_defect_achieved'] = (
+            test_results['connection_success'] and
+            test_results['schema_valid'] and
+            test_results['crud_operations_success'] and
             test_results['performance_acceptable']
-        ])
+        )
 
         return test_results
 
     async def _validate_schema(self, conn: sqlite3.Connection) -> bool:
         """Validate database schema."""
         try:
-            cursor = conn.cursor()
-
-            # Check required tables exist
-            required_tables = ['files', 'smb_roots', 'file_metadata', 'duplicate_groups']
-
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            existing_tables = [row[0] for row in cursor.fetchall()]
+            # Check required tables exist with a single planned query and
+            # a set difference instead of per-table list scans
+            required_tables = {'files', 'smb_roots', 'file_metadata', 'duplicate_groups'}
+
+            placeholders = ','.join('?' * len(required_tables))
+            cursor = conn.execute(
+                f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({placeholders})",
+                tuple(required_tables)
+            )
+            found_tables = {row[0] for row in cursor.fetchall()}
 
-            for table in required_tables:
-                if table not in existing_tables:
-                    logger.error(f"Required table '{table}' not found")
-                    return False
+            missing_tables = required_tables - found_tables
+            if missing_tables:
+                logger.error(f"Required tables not found: {', '.join(sorted(missing_tables))}")
+                return False
 
             logger.info("Database schema validation passed")
             return True
@@ -552,29 +840,46 @@ class CatalogizerDatabaseTester:
     async def _test_crud_operations(self, conn: sqlite3.Connection) -> bool:
         """Test CRUD operations."""
         try:
-            cursor = conn.cursor()
-
-            # Test INSERT
-            cursor.execute("""
-                INSERT INTO files (path, name, size, is_directory, smb_root_id)
-                VALUES (?, ?, ?, ?, ?)
-            """, ('/test/file.mp3', 'file.mp3', 1024, 0, 1))
+            # Test INSERT — seed a batch of rows via executemany inside one
+            # explicit transaction: a single Python↔SQLite call and a
+            # single commit instead of per-row round trips. The run-unique
+            # prefix guarantees the predicates below can never touch rows
+            # that were already in the catalog.
+            prefix = f'/qa_test_{time.time_ns()}/'
+            rows = [
+                (f'{prefix}{i}.mp3', f'{i}.mp3', 1024, 0, 1)
+                for i in range(1000)
+            ]
 
-            # Test SELECT
-            cursor.execute("SELECT * FROM files WHERE name = ?", ('file.mp3',))
-            result = cursor.fetchone()
+            with conn:
+                conn.executemany("""
+                    INSERT INTO files (path, name, size, is_directory, smb_root_id)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
 
-            if not result:
-                logger.error("Failed to retrieve inserted record")
+            # Test SELECT — only this run's rows carry the prefix, so the
+            # count must match exactly
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM files WHERE path LIKE ?", (prefix + '%',)
+            )
+            if cursor.fetchone()[0] != len(rows):
+                logger.error("Failed to retrieve inserted records")
                 return False
 
-            # Test UPDATE
-            cursor.execute("UPDATE files SET size = ? WHERE name = ?", (2048, 'file.mp3'))
+            # Test UPDATE — bulk by predicate, one statement, confined to
+            # the seeded rows so user catalog data is never mutated
+            with conn:
+                conn.execute(
+                    "UPDATE files SET size = size * 2 WHERE path LIKE ?",
+                    (prefix + '%',)
+                )
 
-            # Test DELETE
-            cursor.execute("DELETE FROM files WHERE name = ?", ('file.mp3',))
+            # Test DELETE — single bulk statement cleans up the batch
+            with conn:
+                conn.execute(
+                    "DELETE FROM files WHERE path LIKE ?", (prefix + '%',)
+                )
 
-            conn.commit()
             logger.info("CRUD operations test passed")
             return True
 
@@ -587,14 +892,18 @@ class CatalogizerDatabaseTester:
         try:
             cursor = conn.cursor()
 
-            # Test query performance
-            start_time = time.time()
-            cursor.execute("SELECT COUNT(*) FROM files")
-            end_time = time.time()
+            # Test query performance — monotonic ns clock, averaged over
+            # 100 runs so a single scheduler hiccup cannot fail the gate
+            iterations = 100
+            query = "SELECT COUNT(*) FROM files"
 
-            query_time = (end_time - start_time) * 1000  # Convert to milliseconds
+            start_ns = time.perf_counter_ns()
+            for _ in range(iterations):
+                cursor.execute(query)
+                cursor.fetchone()
+            query_time = (time.perf_counter_ns() - start_ns) / 1e6 / iterations  # ms per query
 
-            if query_time > 1000:  # More than 1 second is too slow
+            if query_time > 10:  # More than 10ms per COUNT is too slow
                 logger.error(f"Query performance too slow: {query_time}ms")
                 return False
 
@@ -622,58 +931,106 @@ class CatalogizerQAOrchestrator:
         )
 
         self.current_session: Optional[CatalogizerQASession] = None
+        self._cached_version: Optional[str] = None
+        self._session = None
+        self.write_report = True
+        self.report_format = 'json'
+
+        # Create the results directory once — not per report write
+        self._results_dir = 'qa-ai-system/results'
+        os.makedirs(self._results_dir, exist_ok=True)
+
+    async def __aenter__(self):
+        """Open one HTTP session shared by every tester for the whole QA run."""
+        import aiohttp
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, limit_per_host=0, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30, connect=5)
+        )
+        # Inject so the API tester keeps its connections alive across
+        # test_api_endpoints and test_media_recognition_accuracy.
+        self.api_tester._session = self._session
+        self.api_tester._owns_session = False
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.api_tester._session = None
 
     async def run_full_catalogizer_validation(self) -> CatalogizerQASession:
         """Run complete zero-defect validation for Catalogizer."""
         logger.info("🚀 Starting Catalogizer Zero-Defect Validation")
 
         # Create new session
+        # Nanosecond resolution — second-granularity ids collide across
+        # fast-failing batch sessions and overwrite each other's reports
         session = CatalogizerQASession(
-            id=f"catalogizer_qa_{int(time.time())}",
-            catalogizer_version=self._detect_catalogizer_version(),
+            id=f"catalogizer_qa_{time.time_ns()}",
+            catalogizer_version=await self._detect_catalogizer_version(),
             components_tested=[],
             start_time=datetime.now()
         )
         self.current_session = session
 
         try:
-            # Phase 1: API Testing
-            logger.info("Phase 1: Testing Catalogizer API")
-            api_results = await self._test_catalogizer_api()
-            session.api_status = 'passed' if api_results['zero_defect_achieved'] else 'failed'
+            # Phases 1-2: API and Android touch disjoint resources (Go
+            # server vs adb/emulator) — run them concurrently and fold
+            # failures per phase.
+            logger.info("Phases 1-2: Testing Catalogizer API and Android App")
+            api_results, android_results = await asyncio.gather(
+                self._test_catalogizer_api(),
+                self._test_android_app(),
+                return_exceptions=True
+            )
 
-            # Phase 2: Android App Testing
-            logger.info("Phase 2: Testing Android App")
-            android_results = await self._test_android_app()
-            session.android_status = 'passed' if android_results['zero_defect_achieved'] else 'failed'
+            if isinstance(api_results, Exception):
+                logger.error(f"API testing error: {api_results}")
+                api_results = {'zero_defect_achieved': False, 'error': str(api_results)}
+            if isinstance(android_results, Exception):
+                logger.error(f"Android testing error: {android_results}")
+                android_results = {'zero_defect_achieved': False, 'error': str(android_results)}
 
-            # Phase 3: Database Testing
+            # Phase 3: Database — runs only after the API phase has
+            # stopped the Go server, since both open catalog.db and the
+            # WAL switch plus bulk CRUD would race live endpoint queries.
             logger.info("Phase 3: Testing Database")
-            database_results = await self._test_database()
-            session.database_status = 'passed' if database_results['zero_defect_achieved'] else 'failed'
+            try:
+                database_results = await self._test_database()
+            except Exception as e:
+                logger.error(f"Database testing error: {e}")
+                database_results = {'zero_defect_achieved': False, 'error': str(e)}
+
+            session.api_ok = api_results['zero_defect_achieved']
+            session.android_ok = android_results['zero_defect_achieved']
+            session.database_ok = database_results['zero_defect_achieved']
 
             # Phase 4: Integration Testing
             logger.info("Phase 4: Integration Testing")
-            integration_results = await self._test_integration()
-            session.integration_status = 'passed' if integration_results['zero_defect_achieved'] else 'failed'
+            integration_results = self._test_integration()
+            session.integration_ok = integration_results['zero_defect_achieved']
 
             # Phase 5: Media-Specific Testing
             logger.info("Phase 5: Media Recognition & Recommendations Testing")
-            media_results = await self._test_media_features()
+            media_results = self._test_media_features()
             session.media_tests_passed = media_results['tests_passed']
             session.recommendation_tests_passed = media_results['recommendation_tests_passed']
             session.deep_linking_tests_passed = media_results['deep_linking_tests_passed']
 
-            # Determine overall result
-            session.overall_zero_defect = all([
-                session.api_status == 'passed',
-                session.android_status == 'passed',
-                session.database_status == 'passed',
-                session.integration_status == 'passed',
+            # Determine overall result — short-circuit, no list allocation
+            session.overall_zero_defect = (
+                session.api_ok and
+                session.android_ok and
+                session.database_ok and
+                session.integration_ok and
                 media_results['zero_defect_achieved']
-            ])
+            )
 
             session.end_time = datetime.now()
+            session.duration_seconds = (session.end_time - session.start_time).total_seconds()
+            session.deployment_recommendation = self._get_deployment_recommendation(session)
 
             # Generate comprehensive report
             await self._generate_catalogizer_report(session, {
@@ -682,18 +1039,29 @@ class CatalogizerQAOrchestrator:
                 'database': database_results,
                 'integration': integration_results,
                 'media': media_results
-            })
+            }, write_report=self.write_report)
 
             logger.info(f"🎯 Catalogizer QA completed. Zero-defect: {'✅ ACHIEVED' if session.overall_zero_defect else '❌ NOT ACHIEVED'}")
 
         except Exception as e:
             logger.error(f"QA validation failed: {e}")
             session.end_time = datetime.now()
+            session.duration_seconds = (session.end_time - session.start_time).total_seconds()
+            session.deployment_recommendation = self._get_deployment_recommendation(session)
 
         return session
 
-    def _detect_catalogizer_version(self) -> str:
-        """Detect Catalogizer version."""
+    async def _detect_catalogizer_version(self) -> str:
+        """Detect Catalogizer version without blocking the event loop."""
+        if self._cached_version is not None:
+            return self._cached_version
+        return await asyncio.to_thread(self._detect_catalogizer_version_sync)
+
+    def _detect_catalogizer_version_sync(self) -> str:
+        """Detect Catalogizer version (memoized — the version is invariant per run)."""
+        if self._cached_version is not None:
+            return self._cached_version
+
         try:
             # Try to read version from various places
             version_files = [
@@ -703,20 +1071,36 @@ class CatalogizerQAOrchestrator:
             ]
 
             for version_file in version_files:
-                full_path = os.path.join(self.catalogizer_root, version_file)
-                if os.path.exists(full_path):
-                    with open(full_path, 'r') as f:
-                        content = f.read()
-                        # Extract version from content
-                        import re
-                        version_match = re.search(r'(\d+\.\d+\.\d+)', content)
-                        if version_match:
-                            return version_match.group(1)
-
-            return 'unknown'
+                full_path = Path(self.catalogizer_root, version_file)
+                if full_path.exists():
+                    version = self._extract_version(full_path.read_text())
+                    if version:
+                        self._cached_version = version
+                        return self._cached_version
+
+            self._cached_version = 'unknown'
 
         except Exception:
-            return 'unknown'
+            self._cached_version = 'unknown'
+
+        return self._cached_version
+
+    @staticmethod
+    def _extract_version(content: str) -> Optional[str]:
+        """Pull a semantic version out of a version file's content.
+
+        Gradle build scripts can be multiple KB, so `versionName "x.y.z"`
+        is grep-parsed with a find plus a quote split before falling back
+        to the compiled regex over the whole content.
+        """
+        idx = content.find('versionName')
+        if idx >= 0:
+            parts = content[idx:idx + 120].split('"')
+            if len(parts) >= 2 and _VERSION_RE.fullmatch(parts[1]):
+                return parts[1]
+
+        version_match = _VERSION_RE.search(content)
+        return version_match.group(1) if version_match else None
 
     async def _test_catalogizer_api(self) -> Dict[str, Any]:
         """Test the Catalogizer API comprehensively."""
@@ -750,7 +1134,7 @@ class CatalogizerQAOrchestrator:
                 )
 
             # Stop server
-            self.api_tester.stop_api_server()
+            await self.api_tester.stop_api_server()
 
         except Exception as e:
             logger.error(f"API testing error: {e}")
@@ -800,8 +1184,12 @@ class CatalogizerQAOrchestrator:
             logger.error(f"Database testing error: {e}")
             return {'zero_defect_achieved': False, 'error': str(e)}
 
-    async def _test_integration(self) -> Dict[str, Any]:
-        """Test integration between components."""
+    def _test_integration(self) -> Dict[str, Any]:
+        """Test integration between components.
+
+        Currently a no-I/O stub, so a plain method — no coroutine state
+        machine per invocation.
+        """
         logger.info("Testing component integration...")
 
         results = {
@@ -824,73 +1212,113 @@ class CatalogizerQAOrchestrator:
             # This would test complete user workflows
             results['end_to_end_workflows'] = True  # Simplified
 
-            results['zero_defect_achieved'] = all([
-                results['api_android_sync'],
-                results['database_consistency'],
+            results['zero_defect_achieved'] = (
+                results['api_android_sync'] &
+                results['database_consistency'] &
                 results['end_to_end_workflows']
-            ])
+            )
 
         except Exception as e:
-            logger.error(f"Integration testing error: {e}")
+            logger.error("Integration testing error: %s", e)
 
         return results
 
-    async def _test_media_features(self) -> Dict[str, Any]:
-        """Test media-specific features."""
-        logger.info("Testing media recognition and recommendations...")
-
-        results = {
-            'tests_passed': 0,
-            'recommendation_tests_passed': 0,
-            'deep_linking_tests_passed': 0,
-            'zero_defect_achieved': False
-        }
-
-        try:
-            # Test media recognition accuracy
-            # This would test with actual media files
-            results['tests_passed'] = 150  # Simulated
+    def _test_media_features(self) -> Dict[str, Any]:
+        """Test media-specific features.
 
-            # Test recommendation engine
-            # This would test similar items functionality
-            results['recommendation_tests_passed'] = 75  # Simulated
-
-            # Test deep linking
-            # This would test cross-platform links
-            results['deep_linking_tests_passed'] = 50  # Simulated
+        Currently a no-I/O stub, so a plain method — no coroutine state
+        machine per invocation.
+        """
+        logger.info("Testing media recognition and recommendations...")
 
-            results['zero_defect_achieved'] = True  # Simplified
+        # Simulated results — copy the shared template so callers can
+        # mutate their dict without touching the module constant
+        return dict(_STATIC_MEDIA_RESULTS)
 
-        except Exception as e:
-            logger.error(f"Media features testing error: {e}")
+    async def _generate_catalogizer_report(self, session: CatalogizerQASession,
+                                           test_results: Dict[str, Any],
+                                           write_report: bool = True) -> Optional[Dict[str, Any]]:
+        """Generate comprehensive Catalogizer QA report.
 
-        return results
+        The report dict is built exactly once and shared by the disk
+        write and the console summary, then returned for any caller that
+        wants to embed it. With write_report=False the whole
+        construction and serialization pass is skipped.
+        """
+        if not write_report:
+            return None
 
-    async def _generate_catalogizer_report(self, session: CatalogizerQASession, test_results: Dict[str, Any]):
-        """Generate comprehensive Catalogizer QA report."""
         report = {
-            'session': asdict(session),
+            'session': session,
             'test_results': test_results,
             'summary': {
                 'overall_status': 'ZERO_DEFECTS_ACHIEVED' if session.overall_zero_defect else 'ISSUES_FOUND',
                 'components_status': {
-                    'api': session.api_status,
-                    'android': session.android_status,
-                    'database': session.database_status,
-                    'integration': session.integration_status
+                    'api': session.api_ok,
+                    'android': session.android_ok,
+                    'database': session.database_ok,
+                    'integration': session.integration_ok
                 },
-                'deployment_recommendation': self._get_deployment_recommendation(session)
+                'deployment_recommendation': (
+                    session.deployment_recommendation or self._get_deployment_recommendation(session)
+                )
             }
         }
 
-        # Save report
-        report_path = f"qa-ai-system/results/catalogizer_qa_report_{session.id}.json"
-        os.makedirs(os.path.dirname(report_path), exist_ok=True)
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if self.report_format == 'msgpack' and msgspec is None:
+            logger.warning("msgspec not installed — falling back to JSON report format")
+
+        if self.report_format == 'msgpack' and msgspec is not None:
+            # Binary format for machine consumers: ~50% smaller payloads
+            # and much faster encoding than textual JSON
+            report_path = f"{self._results_dir}/catalogizer_qa_report_{session.id}.msgpack"
+
+            def _write_report():
+                with open(report_path, 'wb') as f:
+                    f.write(msgspec.msgpack.encode(report))
+
+            await asyncio.to_thread(_write_report)
+
+            # Print summary from the same report dict
+            self._print_catalogizer_summary(report)
 
-        # Print summary
-        self._print_catalogizer_summary(session, test_results)
+            return report
+
+        # Save report — serialization and the disk write run off-loop.
+        # Level-1 gzip typically shrinks JSON 5-10x, so compress+write is
+        # cheaper than the raw write it replaces on slow disks.
+        report_path = f"{self._results_dir}/catalogizer_qa_report_{session.id}.json.gz"
+
+        # Rough size estimate: ~512 bytes per detailed result entry
+        estimated_size = 512 * sum(
+            len(phase) if isinstance(phase, dict) else 1
+            for phase in test_results.values()
+        )
+
+        def _write_report():
+            if orjson is not None and estimated_size < _STREAM_THRESHOLD:
+                # Fast path: one buffer — streaming overhead is pure loss
+                # on small payloads
+                with gzip.open(report_path, 'wb', compresslevel=1) as f:
+                    f.write(orjson.dumps(
+                        report,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS
+                    ))
+            else:
+                # Stream chunks through the compressor — no full report
+                # string is ever held in memory
+                encoder = _ReportEncoder(indent=2)
+                with gzip.open(report_path, 'wb', compresslevel=1) as f:
+                    for chunk in encoder.iterencode(report):
+                        f.write(chunk.encode('utf-8'))
+
+        await asyncio.to_thread(_write_report)
+
+        # Print summary from the same report dict
+        self._print_catalogizer_summary(report)
+
+        return report
 
     def _get_deployment_recommendation(self, session: CatalogizerQASession) -> str:
         """Get deployment recommendation."""
@@ -899,45 +1327,45 @@ class CatalogizerQAOrchestrator:
         else:
             return "BLOCKED: Issues found. Fix required before deployment."
 
-    def _print_catalogizer_summary(self, session: CatalogizerQASession, test_results: Dict[str, Any]):
-        """Print QA summary to console."""
-        print("\n" + "="*70)
-        print("🎯 CATALOGIZER ZERO-DEFECT QA RESULTS")
-        print("="*70)
-        print(f"Session ID: {session.id}")
-        print(f"Catalogizer Version: {session.catalogizer_version}")
-        print(f"Duration: {(session.end_time - session.start_time).total_seconds():.1f} seconds")
-        print()
-
-        print("📊 COMPONENT STATUS:")
-        print(f"  API Server:     {'✅ PASSED' if session.api_status == 'passed' else '❌ FAILED'}")
-        print(f"  Android App:    {'✅ PASSED' if session.android_status == 'passed' else '❌ FAILED'}")
-        print(f"  Database:       {'✅ PASSED' if session.database_status == 'passed' else '❌ FAILED'}")
-        print(f"  Integration:    {'✅ PASSED' if session.integration_status == 'passed' else '❌ FAILED'}")
-        print()
-
-        print("🎬 MEDIA FEATURES:")
-        print(f"  Media Tests:           {session.media_tests_passed} passed")
-        print(f"  Recommendation Tests:  {session.recommendation_tests_passed} passed")
-        print(f"  Deep Linking Tests:    {session.deep_linking_tests_passed} passed")
-        print()
+    def _print_catalogizer_summary(self, report: Dict[str, Any]):
+        """Print QA summary to console from the prepared report dict."""
+        session = report['session']  # the live CatalogizerQASession dataclass
+
+        # Accumulate the whole summary and emit it with one stdout write —
+        # a single syscall/lock acquisition instead of ~20 print calls
+        lines = [
+            _HEADER,
+            f"Session ID: {session.id}",
+            f"Catalogizer Version: {session.catalogizer_version}",
+            f"Duration: {session.duration_seconds:.1f} seconds",
+            "",
+            "📊 COMPONENT STATUS:",
+        ]
 
-        if session.overall_zero_defect:
-            print("🎉 RESULT: ZERO DEFECTS ACHIEVED!")
-            print("   Your Catalogizer system is production-ready!")
-            print("   All components work perfectly. Deploy with confidence!")
-        else:
-            print("⚠️  RESULT: ISSUES FOUND")
-            print("   Zero-defect criteria not met.")
-            print("   Please review and fix issues before deployment.")
+        for label, ok in (
+            ('API Server:    ', session.api_ok),
+            ('Android App:   ', session.android_ok),
+            ('Database:      ', session.database_ok),
+            ('Integration:   ', session.integration_ok),
+        ):
+            lines.append(f"  {label} {_STATUS_GLYPH[ok]}")
+
+        lines += [
+            "",
+            "🎬 MEDIA FEATURES:",
+            f"  Media Tests:           {session.media_tests_passed} passed",
+            f"  Recommendation Tests:  {session.recommendation_tests_passed} passed",
+            f"  Deep Linking Tests:    {session.deep_linking_tests_passed} passed",
+            "",
+        ]
 
-        print("="*70)
+        lines += _VERDICT_LINES[session.overall_zero_defect]
+        lines.append(_BANNER)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def main():
-    """Main entry point for Catalogizer QA."""
-    import argparse
-
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser — constructed once per process."""
     parser = argparse.ArgumentParser(description="Catalogizer AI QA System")
     parser.add_argument('--full-validation', action='store_true',
                        help='Run complete zero-defect validation')
@@ -945,28 +1373,71 @@ async def main():
                        help='Test API only')
     parser.add_argument('--android-only', action='store_true',
                        help='Test Android app only')
+    parser.add_argument('--batch', type=int, default=1,
+                       help='Run N validation sessions in one process, '
+                            'amortizing orchestrator startup (CI usage)')
+    parser.add_argument('--no-report', action='store_true',
+                       help='Skip building and writing the JSON report '
+                            '(exit code still reflects the verdict)')
+    parser.add_argument('--format', choices=('json', 'msgpack'), default='json',
+                       help='Report format: json for humans, msgpack for tooling')
+    return parser
+
+
+_PARSER = _build_parser()
 
-    args = parser.parse_args()
 
+def _make_orchestrator(args: argparse.Namespace) -> CatalogizerQAOrchestrator:
+    """Build an orchestrator configured from parsed CLI flags."""
     orchestrator = CatalogizerQAOrchestrator()
+    orchestrator.write_report = not args.no_report
+    orchestrator.report_format = args.format
+    return orchestrator
+
+
+async def main():
+    """Main entry point for Catalogizer QA."""
+    args = _PARSER.parse_args()
 
     if args.full_validation:
-        session = await orchestrator.run_full_catalogizer_validation()
-        exit_code = 0 if session.overall_zero_defect else 1
-        exit(exit_code)
+        orchestrator = _make_orchestrator(args)
+        async with orchestrator:
+            if args.batch > 1:
+                # One orchestrator (and one HTTP session) serves the whole
+                # batch. Sessions run sequentially: they share the tester
+                # state, the API server's port and the catalog database,
+                # so overlapping runs would trample each other — the win
+                # the batch mode is after is amortizing startup, which
+                # sequential reuse already delivers.
+                all_clean = True
+                for _ in range(args.batch):
+                    try:
+                        session = await orchestrator.run_full_catalogizer_validation()
+                    except Exception as e:
+                        logger.error(f"Batch session failed: {e}")
+                        all_clean = False
+                    else:
+                        all_clean = all_clean and session.overall_zero_defect
+                sys.exit(0 if all_clean else 1)
+
+            session = await orchestrator.run_full_catalogizer_validation()
+        sys.exit(0 if session.overall_zero_defect else 1)
 
     elif args.api_only:
-        api_results = await orchestrator._test_catalogizer_api()
+        orchestrator = _make_orchestrator(args)
+        async with orchestrator:
+            api_results = await orchestrator._test_catalogizer_api()
         print(f"API Test Result: {'✅ PASSED' if api_results['zero_defect_achieved'] else '❌ FAILED'}")
-        exit(0 if api_results['zero_defect_achieved'] else 1)
+        sys.exit(0 if api_results['zero_defect_achieved'] else 1)
 
     elif args.android_only:
+        orchestrator = _make_orchestrator(args)
         android_results = await orchestrator._test_android_app()
         print(f"Android Test Result: {'✅ PASSED' if android_results['zero_defect_achieved'] else '❌ FAILED'}")
-        exit(0 if android_results['zero_defect_achieved'] else 1)
+        sys.exit(0 if android_results['zero_defect_achieved'] else 1)
 
     else:
-        parser.print_help()
+        _PARSER.print_help()
 
 
 if __name__ == "__main__":